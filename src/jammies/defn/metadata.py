@@ -271,7 +271,7 @@ class ProjectMetadataCodec(DictCodec[ProjectMetadata]):
         `ProjectFile`
             The decoded project file.
         """
-        return self.registrar.get_project_file_codec(file['type']).decode(file)
+        return self.registrar.decode_project_file(file)
 
     def decode(self, obj: DictObject) -> ProjectMetadata:
         return ProjectMetadata(list(map(self.__decode_file, obj['files'])),
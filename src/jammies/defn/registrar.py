@@ -1,12 +1,14 @@
 """A script containing the implemented registrar used within the project."""
 
-from typing import Dict, Any
+from typing import Dict, Any, Mapping, Tuple, Callable, Iterable
+from types import MappingProxyType
 
 from jammies.log import Logger
 from jammies.config import JammiesConfig
 from jammies.struct.registry import Registry
 from jammies.registrar import JammiesRegistrar, ProjectFileBuilder
-from jammies.defn.file import ProjectFileCodec, PostProcessor
+from jammies.defn.file import ProjectFile, ProjectFileCodec, PostProcessor
+from jammies.struct.codec import DictObject
 from jammies.defn.metadata import METADATA_CODEC
 
 import jammies.internal.file.osf as file_osf
@@ -35,17 +37,30 @@ class JammiesRegistrarImpl(JammiesRegistrar):
         self.__stager: int = 0
 
         # Project File Handlers
-        self.file_codecs: Registry[ProjectFileCodec] = Registry()
-        self.file_builders: Registry[ProjectFileBuilder] = Registry()
-        self.file_handler_exceptions: Registry[str] = Registry()
+        self.__file_codecs: Registry[ProjectFileCodec] = Registry()
+        self.__file_builders: Registry[ProjectFileBuilder] = Registry()
+        self.__file_handler_exceptions: Registry[str] = Registry()
+        # Decode methods of the codecs, dispatched on directly
+        self.__file_decoders: Dict[str, Callable[[DictObject], ProjectFile]] = {}
 
         # Post Processors
-        self.post_processors: Registry[PostProcessor] = Registry()
-        self.post_processor_exceptions: Registry[str] = Registry()
+        self.__post_processors: Registry[PostProcessor] = Registry()
+        self.__post_processor_exceptions: Registry[str] = Registry()
 
-    def __check_preconditions(self, name: str, registry: Dict[str, Any],
+        # Views of the registries, replaced with read-only views once frozen
+        self.file_codecs: Mapping[str, ProjectFileCodec] = self.__file_codecs
+        self.file_builders: Mapping[str, ProjectFileBuilder] = self.__file_builders
+        self.file_handler_exceptions: Mapping[str, str] = self.__file_handler_exceptions
+        self.post_processors: Mapping[str, PostProcessor] = self.__post_processors
+        self.post_processor_exceptions: Mapping[str, str] = self.__post_processor_exceptions
+
+        # Available builder names, computed once frozen
+        self.__available_builders: Tuple[str, ...] | None = None
+
+    def __check_registered(self, name: str, registry: Dict[str, Any],
             registry_type: str) -> None:
-        """Checks the preconditions necessary to access a registry method.
+        """Checks that the name is not already registered. Used when
+        registering internal logic.
         
         Parameters
         ----------
@@ -57,57 +72,125 @@ class JammiesRegistrarImpl(JammiesRegistrar):
             A string representation of the registry data.
         """
 
-        if self.__stager > 1:
-            raise RegistryError(f'{name} could not be registered; the registry has been frozen.')
-        if self.__stager > 0 and ':' not in name:
-            raise ValueError(f'{name} must contain a \':\', '\
-                + 'where the prefix represents a unique identifier for the group of scripts.')
         if name in registry:
             raise ValueError(f'{name} already has a registered {registry_type}.')
 
+    def __check_dynamic_preconditions(self, name: str, registry: Dict[str, Any],
+            registry_type: str) -> None:
+        """Checks that the name is prefixed by a group identifier and is not
+        already registered. Used when registering dynamic script logic.
+        
+        Parameters
+        ----------
+        name : str
+            The name of the object to register.
+        registry : dict
+            The registry to registry the object to.
+        registry_type : str
+            A string representation of the registry data.
+        """
+
+        if ':' not in name:
+            raise ValueError(f'{name} must contain a \':\', '\
+                + 'where the prefix represents a unique identifier for the group of scripts.')
+        self.__check_registered(name, registry, registry_type)
+
+    def __check_frozen(self, name: str, registry: Dict[str, Any], # pylint: disable=unused-argument
+            registry_type: str) -> None:
+        """Rejects all registrations. Used once the registry has been frozen.
+        
+        Parameters
+        ----------
+        name : str
+            The name of the object to register.
+        registry : dict
+            The registry to registry the object to.
+        registry_type : str
+            A string representation of the registry data.
+        """
+
+        raise RegistryError(f'{name} could not be registered; the registry has been frozen.')
+
+    __STAGE_PRECONDITIONS: Tuple[Callable[['JammiesRegistrarImpl', str, Dict[str, Any], str],
+        None], ...] = (__check_registered, __check_dynamic_preconditions, __check_frozen)
+    """The preconditions checked before registering, indexed by stage."""
+
+    def __check_preconditions(self, name: str, registry: Dict[str, Any],
+            registry_type: str) -> None:
+        """Checks the preconditions necessary to access a registry method
+        for the current stage.
+        
+        Parameters
+        ----------
+        name : str
+            The name of the object to register.
+        registry : dict
+            The registry to registry the object to.
+        registry_type : str
+            A string representation of the registry data.
+        """
+
+        # Stages past the last remain frozen
+        self.__STAGE_PRECONDITIONS[min(self.__stager, len(self.__STAGE_PRECONDITIONS) - 1)](
+            self, name, registry, registry_type)
+
     def register_file_handler(self, name: str, codec: ProjectFileCodec,
             builder: ProjectFileBuilder) -> None:
-        self.__check_preconditions(name, self.file_codecs, 'file handler')
+        self.__check_preconditions(name, self.__file_codecs, 'file handler')
 
-        self.file_codecs[name] = codec
-        self.file_builders[name] = builder
+        self.__file_codecs[name] = codec
+        self.__file_builders[name] = builder
+        self.__file_decoders[name] = codec.decode
 
     def add_file_handler_missing_message(self, name: str, message: str) -> None:
-        self.__check_preconditions(name, self.file_handler_exceptions, 'message')
-        if name in self.file_codecs:
+        self.__check_preconditions(name, self.__file_handler_exceptions, 'message')
+        if name in self.__file_codecs:
             raise ValueError(f'{name} is registered, a message handler is not needed.')
 
-        self.file_handler_exceptions[name] = message
+        self.__file_handler_exceptions[name] = message
 
     def register_post_processor(self, name: str, post_processor: PostProcessor) -> None:
-        self.__check_preconditions(name, self.post_processors, 'post processor')
+        self.__check_preconditions(name, self.__post_processors, 'post processor')
 
-        self.post_processors[name] = post_processor
+        self.__post_processors[name] = post_processor
 
     def add_post_processor_missing_message(self, name: str, message: str) -> None:
-        self.__check_preconditions(name, self.post_processor_exceptions, 'message')
-        if name in self.post_processors:
+        self.__check_preconditions(name, self.__post_processor_exceptions, 'message')
+        if name in self.__post_processors:
             raise ValueError(f'{name} is registered, a message handler is not needed.')
 
-        self.post_processor_exceptions[name] = message
+        self.__post_processor_exceptions[name] = message
 
     def get_project_file_codec(self, name: str) -> ProjectFileCodec:
         return self.file_codecs[name]
 
+    def decode_project_file(self, obj: DictObject) -> ProjectFile:
+        return self.__file_decoders[obj['type']](obj)
+
     def get_project_file_builder(self, name: str) -> ProjectFileBuilder:
         return self.file_builders[name]
 
     def get_post_processor(self, name: str) -> PostProcessor:
         return self.post_processors[name]
 
-    def get_available_builders(self) -> list[str]:
-        return self.file_builders.keys()
+    def get_available_builders(self) -> Iterable[str]:
+        return self.file_builders.keys() if self.__available_builders is None \
+            else self.__available_builders
 
     def stage(self) -> None:
         """Stages the registrar into its next state.
         """
         self.__stager += 1
 
+        if self.__stager == 2:
+            # Replace registries with read-only views
+            self.file_codecs = MappingProxyType(self.__file_codecs)
+            self.file_builders = MappingProxyType(self.__file_builders)
+            self.file_handler_exceptions = MappingProxyType(self.__file_handler_exceptions)
+            self.post_processors = MappingProxyType(self.__post_processors)
+            self.post_processor_exceptions = MappingProxyType(self.__post_processor_exceptions)
+            self.__available_builders = tuple(self.__file_builders.keys())
+
 REGISTRAR: JammiesRegistrar = JammiesRegistrarImpl()
 
 def setup(logger: Logger, config: JammiesConfig) -> None:
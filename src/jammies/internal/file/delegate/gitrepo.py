@@ -2,9 +2,7 @@
 """
 
 import os
-from typing import Set
-from git import Repo
-from git.util import rmtree
+from typing import FrozenSet, List
 from jammies.utils import get_default, input_with_default, input_yn_default
 from jammies.struct.codec import DictObject
 from jammies.defn.file import ProjectFile, ProjectFileCodec
@@ -26,11 +24,11 @@ def setup_delegate(registrar: JammiesRegistrar) -> None:
 
     registrar.register_file_handler(_REGISTRY_NAME, codec, build_git)
 
-_VALID_BRANCH_TYPES: Set[str] = {
+_VALID_BRANCH_TYPES: FrozenSet[str] = frozenset({
     'branch',
     'commit',
     'tag'
-}
+})
 """A set of valid keys indicating the checkout location of the Git repository."""
 
 class GitProjectFile(ProjectFile):
@@ -63,13 +61,51 @@ class GitProjectFile(ProjectFile):
     def setup(self, root_dir: str, ignore_sub_directory: bool = False) -> bool:
         super().setup(root_dir, ignore_sub_directory = ignore_sub_directory)
         base_path: str = root_dir if ignore_sub_directory else self.create_path(root_dir)
-
-        # Checkout and change branches, if applicable
-        with Repo.clone_from(self.repository, base_path) as repo:
-            if self.branch is not None:
-                repo.git.checkout(self.branch)
-
-        rmtree(os.path.join(base_path, '.git'))
+        git_path: str = os.path.join(base_path, '.git')
+
+        # Import only when needed as GitPython is slow to load
+        from git import Repo, GitCommandError # pylint: disable=import-outside-toplevel
+        from git.util import rmtree # pylint: disable=import-outside-toplevel
+
+        # Shallow clone only the checkout location, as the history is not needed
+        if self.branch is None:
+            Repo.clone_from(self.repository, base_path, depth = 1).close()
+        else:
+            try:
+                if self.branch_type == 'commit':
+                    # Fetch only the commit, if the server allows it
+                    with Repo.init(base_path) as repo:
+                        repo.create_remote('origin', self.repository)
+                        repo.git.fetch('origin', self.branch, depth = 1)
+                        repo.git.checkout('FETCH_HEAD')
+                else:
+                    Repo.clone_from(self.repository, base_path,
+                        depth = 1, single_branch = True, branch = self.branch).close()
+            except GitCommandError:
+                if ignore_sub_directory or os.path.normpath(self.dir) == os.curdir:
+                    # The directory is shared with other files, so keep any partial checkout
+                    ## Then, fetch the entire repository into it and checkout the location
+                    with Repo(base_path) if os.path.isdir(git_path) \
+                            else Repo.init(base_path) as repo:
+                        if 'origin' not in repo.remotes:
+                            repo.create_remote('origin', self.repository)
+                        fetch_args: List[str] = ['origin', '+refs/heads/*:refs/remotes/origin/*']
+                        if os.path.isfile(os.path.join(git_path, 'shallow')):
+                            fetch_args.append('--unshallow')
+                        repo.git.fetch(*fetch_args, tags = True)
+                        if not repo.head.is_valid():
+                            # Start from the default branch, as a clone would
+                            repo.git.remote('set-head', 'origin', '--auto')
+                            repo.git.checkout('origin/HEAD', force = True)
+                        repo.git.checkout(self.branch, force = True)
+                else:
+                    # Otherwise, remove the directory containing the partial checkout
+                    ## Then, clone the entire repository and checkout the location
+                    rmtree(base_path)
+                    with Repo.clone_from(self.repository, base_path) as repo:
+                        repo.git.checkout(self.branch)
+
+        rmtree(git_path)
         return True
 
 def build_git(registrar: JammiesRegistrar) -> GitProjectFile:
@@ -109,12 +145,13 @@ class GitProjectFileCodec(ProjectFileCodec[GitProjectFile]):
 
     def decode_type(self, obj: DictObject, **kwargs: DictObject) -> GitProjectFile:
         kwargs['codec'] = self # Set codec
-        for branch_name in _VALID_BRANCH_TYPES: # type: str
-            if branch_name in obj:
-                return GitProjectFile(
-                    obj['repository'],
-                    branch = obj[branch_name],
-                    branch_type = branch_name,
-                    **kwargs
-                )
+        # Find the checkout location, if present
+        if branch_names := obj.keys() & _VALID_BRANCH_TYPES:
+            branch_name: str = next(iter(branch_names))
+            return GitProjectFile(
+                obj['repository'],
+                branch = obj[branch_name],
+                branch_type = branch_name,
+                **kwargs
+            )
         return GitProjectFile(obj['repository'], **kwargs)
@@ -1,9 +1,10 @@
 """A script containing the definition of a registrar used to register
 the necessary components of the project.
 """
-from typing import TypeAlias, Callable
+from typing import TypeAlias, Callable, Iterable
 from abc import ABC, abstractmethod
 from jammies.defn.file import ProjectFileCodec, ProjectFile, PostProcessor
+from jammies.struct.codec import DictObject
 
 ProjectFileBuilder: TypeAlias = Callable[['JammiesRegistrar'], ProjectFile]
 """A supplier used to construct a ProjectFile from an user's input."""
@@ -89,6 +90,21 @@ class JammiesRegistrar(ABC):
             The registered codec.
         """
 
+    def decode_project_file(self, obj: DictObject) -> ProjectFile:
+        """Decodes a `ProjectFile` using the codec registered to its type.
+
+        Parameters
+        ----------
+        obj : Dict[str, Any]
+            The encoded project file.
+
+        Returns
+        -------
+        `ProjectFile`
+            The decoded project file.
+        """
+        return self.get_project_file_codec(obj['type']).decode(obj)
+
     @abstractmethod
     def get_project_file_builder(self, name: str) -> ProjectFileBuilder:
         """Gets a `ProjectFileBuilder` for the associated name.
@@ -120,11 +136,11 @@ class JammiesRegistrar(ABC):
         """
 
     @abstractmethod
-    def get_available_builders(self) -> list[str]:
-        """Returns a list of the available project file builders.
+    def get_available_builders(self) -> Iterable[str]:
+        """Returns the available project file builders.
         
         Returns
         -------
-        list of str
-            A list of project file builder names.
+        iterable of strs
+            The project file builder names.
         """
@@ -4,15 +4,20 @@
 import os
 import re
 import inspect
-from typing import Any, Dict, Callable, TypeVar, Tuple
+from functools import lru_cache
+from typing import Any, Dict, Callable, TypeVar, Tuple, TYPE_CHECKING
 from io import IOBase, BytesIO
 from mimetypes import guess_extension
 from zipfile import ZipFile
 from urllib.parse import urlparse
-import requests
 
+if TYPE_CHECKING:
+    import requests
+
+@lru_cache(maxsize = None)
 def get_default(func: Callable[..., Any], param: str) -> Any | None:
     """Gets the default value of a function parameter, or `None` if not applicable.
+    The result is cached as signatures are expensive to inspect.
     
     Parameters
     ----------
@@ -140,7 +145,7 @@ _CONTENT_DISPOSITION: str = 'content-disposition'
 _CONTENT_TYPE: str = 'content-type'
 """The header for the content type."""
 
-def download_file(url: str, handler: Callable[[requests.Response, str], bool],
+def download_file(url: str, handler: Callable[['requests.Response', str], bool],
         stream: bool = True) -> bool:
     """Downloads a file from the specified url via a GET request and handles the response
     bytes as specified.
@@ -161,6 +166,9 @@ def download_file(url: str, handler: Callable[[requests.Response, str], bool],
         `True` if the file was successfully downloaded, `False` otherwise
     """
 
+    # Import on first download as requests is slow to load
+    import requests # pylint: disable=import-outside-toplevel
+
     # Download data within 5 minutes
     with requests.get(url, stream = stream, allow_redirects = True,
             timeout = 300) as response: # type: requests.Response
@@ -216,7 +224,7 @@ def download_and_write(url: str, unzip_file: bool = True, out_dir: str = os.curd
         `True` if the file was successfully downloaded, `False` otherwise
     """
 
-    def __write(__response: requests.Response, __filename: str, __dir: str) -> bool:
+    def __write(__response: 'requests.Response', __filename: str, __dir: str) -> bool:
         """Writes the file or unzips it to the specified directory.
 
         Parameters
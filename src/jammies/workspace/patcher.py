@@ -21,7 +21,7 @@ class PatchError(ValueError):
     """
 
 def create_patch(from_text: str, to_text: str, filename: str = '',
-        time: str = str(datetime.now())) -> str:
+        time: str | None = None) -> str:
     """Creates a patch between two pieces of text. If equivalent, returns
     an empty string.
 
@@ -33,8 +33,8 @@ def create_patch(from_text: str, to_text: str, filename: str = '',
         The new text the patch will transform the original text to.
     filename : str (default '')
         The name of the file the patch is being applied for.
-    time : datetime.datetime (default str(datetime.datetime.now))
-        The time the patch was generated.
+    time : str | None (default None)
+        The time the patch was generated. When `None`, uses the current time.
 
     Returns
     -------
@@ -42,6 +42,9 @@ def create_patch(from_text: str, to_text: str, filename: str = '',
         The generated patch.
     """
 
+    if time is None:
+        time = str(datetime.now())
+
     diffs: Iterator[str] = unified_diff(
         from_text.splitlines(keepends = True),
         to_text.splitlines(keepends = True),
@@ -6,11 +6,15 @@ import os
 from pathlib import PurePath
 import shutil
 import json
+from codecs import BOM_UTF8
+from concurrent.futures import ThreadPoolExecutor
+from types import ModuleType
+from typing import List, Tuple, Set, FrozenSet, Dict, Iterator
 from datetime import datetime
 from urllib.parse import urlparse
-from requests import Response
 from jammies.log import Logger
-from jammies.utils import download_file
+from jammies.module import has_module, load_module
+from jammies.struct.codec import DictObject
 from jammies.defn.metadata import ProjectMetadata, METADATA_CODEC, build_metadata
 from jammies.workspace.patcher import apply_patch, create_patch
 from jammies.config import JammiesConfig
@@ -21,9 +25,312 @@ PROJECT_METADATA_NAME: str = 'project_metadata.json'
 _PATCH_EXTENSION: str = 'patch'
 """The extension of a patch file."""
 
+_PATCH_SUFFIX_LEN: int = len(_PATCH_EXTENSION) + 1
+"""The length of the extension of a patch file, including the separator."""
+
 _TMP_DIR: str = '.tmp'
 """The directory for temporary files or directories."""
 
+_ORJSON: ModuleType | None = load_module('orjson') if has_module('orjson') else None
+"""The `orjson` module used to read and write JSON, or `None` if not installed."""
+
+_HAS_COPY_FILE_RANGE: bool = hasattr(os, 'copy_file_range')
+"""Whether files can be copied within the kernel, available on Linux."""
+
+_MAX_WORKERS: int = min(32, (os.cpu_count() or 1) * 4)
+"""The maximum number of threads used to process files within a workspace."""
+
+def _walk_tree(root_dir: str, include_hidden: bool = True) -> Iterator[os.DirEntry]:
+    """Iterates through the files and subdirectories within a directory and
+    its subdirectories. Symbolic links to directories are traversed, the same
+    as when copying with `shutil.copytree`, unless they link to the root
+    directory or a directory already reached through a link, which may never
+    end. Such links are skipped.
+
+    Every scan of a directory tree within a workspace goes through this
+    method so that all operations see the same files.
+
+    Parameters
+    ----------
+    root_dir : str
+        The directory to iterate through.
+    include_hidden : bool (default True)
+        When `False`, skips files and directories starting with a '.'.
+
+    Returns
+    -------
+    Iterator of `os.DirEntry`s
+        The entries of the files and subdirectories.
+    """
+
+    root_stat: os.stat_result = os.stat(root_dir)
+    # The directories to scan along with the identifiers of the directories containing them
+    dirs: List[Tuple[str, FrozenSet[Tuple[int, int]]]] = \
+        [(root_dir, frozenset({(root_stat.st_dev, root_stat.st_ino)}))]
+    while dirs:
+        dir_path, parents = dirs.pop()
+        with os.scandir(dir_path) as entries: # type: Iterator[os.DirEntry]
+            for entry in entries: # type: os.DirEntry
+                if not include_hidden and entry.name.startswith('.'):
+                    continue
+
+                if entry.is_dir():
+                    if entry.is_symlink():
+                        # Skip links back to a directory being traversed
+                        ## 'os.DirEntry.stat' does not set the identifiers on Windows
+                        dir_stat: os.stat_result = os.stat(entry.path)
+                        if (dir_id := (dir_stat.st_dev, dir_stat.st_ino)) in parents:
+                            continue
+                        dirs.append((entry.path, parents | {dir_id}))
+                    else:
+                        dirs.append((entry.path, parents))
+                yield entry
+
+def _iter_files(root_dir: str) -> Iterator[str]:
+    """Iterates through the paths of all files within a directory and its
+    subdirectories.
+
+    Parameters
+    ----------
+    root_dir : str
+        The directory to iterate through.
+
+    Returns
+    -------
+    Iterator of strs
+        The paths of the files, prefixed by the root directory.
+    """
+    return (entry.path for entry in _walk_tree(root_dir) if not entry.is_dir())
+
+def _copy_file(src: str, dst: str) -> None:
+    """Copies a file along with its metadata. When supported, the data is copied
+    within the kernel via `os.copy_file_range`, which shares the underlying
+    blocks on copy-on-write file systems. Otherwise, falls back to `shutil.copy2`.
+
+    Parameters
+    ----------
+    src : str
+        The path of the file to copy.
+    dst : str
+        The path to copy the file to.
+    """
+
+    if _HAS_COPY_FILE_RANGE:
+        try:
+            with open(src, mode = 'rb') as src_file, open(dst, mode = 'wb') as dst_file:
+                remaining: int = os.fstat(src_file.fileno()).st_size
+                while remaining > 0 and (copied := os.copy_file_range(
+                        src_file.fileno(), dst_file.fileno(), remaining)) > 0:
+                    remaining -= copied
+
+            # Only keep the copy if all data was transferred
+            if remaining <= 0:
+                shutil.copystat(src, dst)
+                return
+        except OSError:
+            pass # Unsupported by the file system, fall back to a normal copy
+
+    shutil.copy2(src, dst)
+
+def _scan_tree(root_dir: str,
+        include_hidden: bool = True) -> Tuple[Dict[str, os.DirEntry], Dict[str, os.DirEntry]]:
+    """Collects the files and subdirectories within a directory, relative to
+    the directory.
+
+    Parameters
+    ----------
+    root_dir : str
+        The directory to scan.
+    include_hidden : bool (default True)
+        When `False`, skips files and directories starting with a '.'.
+
+    Returns
+    -------
+    (dict of strs to `os.DirEntry`s, dict of strs to `os.DirEntry`s)
+        A tuple of the files and subdirectories, respectively, keyed by their
+        relative paths.
+    """
+
+    prefix_len: int = len(root_dir) + 1
+    files: Dict[str, os.DirEntry] = {}
+    subdirs: Dict[str, os.DirEntry] = {}
+
+    for entry in _walk_tree(root_dir, include_hidden = include_hidden): # type: os.DirEntry
+        if entry.is_dir():
+            subdirs[entry.path[prefix_len:]] = entry
+        else:
+            files[entry.path[prefix_len:]] = entry
+    return (files, subdirs)
+
+def _copy_tree(src_dir: str, dst_dir: str) -> None:
+    """Copies a directory into another directory, merging with any existing files.
+
+    Parameters
+    ----------
+    src_dir : str
+        The directory to copy.
+    dst_dir : str
+        The directory to copy into.
+    """
+
+    files, subdirs = _scan_tree(src_dir)
+
+    # Create all directories, then copy the files
+    os.makedirs(dst_dir, exist_ok = True)
+    for subdir in subdirs: # type: str
+        os.makedirs(dst_dir + os.sep + subdir, exist_ok = True)
+    for rel_path, src in files.items(): # type: str, os.DirEntry
+        _copy_file(src.path, dst_dir + os.sep + rel_path)
+
+    # Copy directory metadata after their contents are written
+    for subdir, src in subdirs.items(): # type: str, os.DirEntry
+        shutil.copystat(src.path, dst_dir + os.sep + subdir)
+    shutil.copystat(src_dir, dst_dir)
+
+def _sync_tree(files: Dict[str, os.DirEntry], subdirs: Dict[str, os.DirEntry],
+        dst_dir: str) -> None:
+    """Synchronizes a directory with the scanned files and subdirectories.
+    Files whose size and modification time match their source are kept;
+    all other files and directories are removed or replaced.
+
+    Parameters
+    ----------
+    files : dict of strs to `os.DirEntry`s
+        The relative paths of the files to the source files.
+    subdirs : dict of strs to `os.DirEntry`s
+        The relative paths of the subdirectories to the source directories.
+    dst_dir : str
+        The directory to synchronize.
+    """
+
+    prefix_len: int = len(dst_dir) + 1
+    up_to_date: Set[str] = set()
+
+    # Remove anything which is not up to date
+    dirs: List[str] = [dst_dir]
+    while dirs:
+        with os.scandir(dirs.pop()) as entries: # type: Iterator[os.DirEntry]
+            for entry in entries: # type: os.DirEntry
+                rel_path: str = entry.path[prefix_len:]
+
+                if entry.is_dir(follow_symlinks = False):
+                    if rel_path in subdirs:
+                        dirs.append(entry.path)
+                    else:
+                        shutil.rmtree(entry.path)
+                elif (src := files.get(rel_path)) is not None and not entry.is_symlink() \
+                        and (dst_stat := entry.stat(follow_symlinks = False)).st_size \
+                            == (src_stat := src.stat()).st_size \
+                        and dst_stat.st_mtime_ns == src_stat.st_mtime_ns:
+                    up_to_date.add(rel_path)
+                else:
+                    os.remove(entry.path)
+
+    # Create all directories, then copy any missing files
+    for subdir in subdirs: # type: str
+        os.makedirs(dst_dir + os.sep + subdir, exist_ok = True)
+    for rel_path, src in files.items(): # type: str, os.DirEntry
+        if rel_path not in up_to_date:
+            _copy_file(src.path, dst_dir + os.sep + rel_path)
+
+    # Copy directory metadata after their contents are written
+    for subdir, src in subdirs.items(): # type: str, os.DirEntry
+        shutil.copystat(src.path, dst_dir + os.sep + subdir)
+
+def _make_parent_dir(path: str, created_dirs: Set[str] | None = None) -> None:
+    """Creates the parent directory of a path, if necessary.
+
+    Parameters
+    ----------
+    path : str
+        The path to create the parent directory of.
+    created_dirs : set of strs | None (default None)
+        The directories already created. When specified, directories within the
+        set are skipped and newly created directories are added to it.
+    """
+
+    if (parent_dir := os.path.dirname(path)) and \
+            (created_dirs is None or parent_dir not in created_dirs):
+        os.makedirs(parent_dir, exist_ok = True)
+        if created_dirs is not None:
+            created_dirs.add(parent_dir)
+
+def _load_json(data: bytes) -> DictObject:
+    """Reads a JSON object from its UTF-8 encoded bytes. A leading byte order
+    mark is ignored.
+
+    Parameters
+    ----------
+    data : bytes
+        The UTF-8 encoded JSON.
+
+    Returns
+    -------
+    Dict[str, Any]
+        The decoded JSON object.
+    """
+
+    # orjson does not accept a byte order mark
+    if data.startswith(BOM_UTF8):
+        data = data[len(BOM_UTF8):]
+    return _ORJSON.loads(data) if _ORJSON else json.loads(data)
+
+def _dump_json(obj: DictObject) -> bytes:
+    """Writes a JSON object to its UTF-8 encoded bytes, indented by two spaces
+    with non-ASCII characters left unescaped. The layout is the same whether
+    or not `orjson` is installed, though some values, such as floats in
+    exponent notation, may be formatted differently.
+
+    Parameters
+    ----------
+    obj : Dict[str, Any]
+        The JSON object to encode.
+
+    Returns
+    -------
+    bytes
+        The UTF-8 encoded JSON.
+    """
+    if _ORJSON:
+        return _ORJSON.dumps(obj, option = _ORJSON.OPT_INDENT_2 | _ORJSON.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, indent = 2, ensure_ascii = False) + '\n').encode('UTF-8')
+
+def _read_text(path: str) -> str:
+    """Reads a UTF-8 encoded file in binary mode, decoding it once.
+    Newlines are translated the same as when reading in text mode.
+
+    Parameters
+    ----------
+    path : str
+        The path of the file to read.
+
+    Returns
+    -------
+    str
+        The text of the file.
+    """
+
+    with open(path, mode = 'rb') as file:
+        text: str = file.read().decode('UTF-8')
+    return text.replace('\r\n', '\n').replace('\r', '\n') if '\r' in text else text
+
+def _write_text(path: str, text: str) -> None:
+    """Writes text to a UTF-8 encoded file in binary mode, encoding it once.
+    Newlines are translated the same as when writing in text mode.
+
+    Parameters
+    ----------
+    path : str
+        The path of the file to write.
+    text : str
+        The text to write.
+    """
+
+    if os.linesep != '\n':
+        text = text.replace('\n', os.linesep)
+    with open(path, mode = 'wb') as file:
+        file.write(text.encode('UTF-8'))
+
 def read_metadata(dirpath: str = os.curdir, import_loc: str | None = None) -> ProjectMetadata:
     """Creates or reads project metadata for the current / to-be workspace.
 
@@ -44,40 +351,22 @@ def read_metadata(dirpath: str = os.curdir, import_loc: str | None = None) -> Pr
     if import_loc is not None:
         # Check if import is a url
         if urlparse(import_loc).scheme in ('http', 'https'):
-            json_bytes: bytes = None
-
-            def get_metadata_str(response: Response) -> bool:
-                """Reads the bytes of a response object into a higher scope variable.
-                
-                Parameters
-                ----------
-                response: response.Response
-                    The response of the request.
-                
-                Returns
-                -------
-                bool
-                    Whether the operation was successfully executed.
-                """
-
-                nonlocal json_bytes
-                json_bytes = response.content
-                return True
-
-            # Download file
-            if download_file(import_loc,
-                lambda response, _: get_metadata_str(response),
-                stream = False
-            ):
-                return write_metadata_to_file(dirpath,
-                    METADATA_CODEC.decode(json.loads(json_bytes)))
+            # Import only when needed as requests is slow to load
+            import requests # pylint: disable=import-outside-toplevel
+
+            # Decode the metadata directly from the downloaded response within 5 minutes
+            with requests.get(import_loc, allow_redirects = True,
+                    timeout = 300) as response: # type: requests.Response
+                if response.ok:
+                    return write_metadata_to_file(dirpath,
+                        METADATA_CODEC.decode(_load_json(response.content)))
 
         # Otherwise, assume import is a path and check if it exists
         elif os.path.exists(import_loc):
             return write_metadata_to_file(dirpath, read_metadata_from_file(import_loc))
 
     # If none, check if project metadata exists in directory
-    if os.path.exists((path := os.sep.join([dirpath, PROJECT_METADATA_NAME]))):
+    if os.path.exists((path := f'{dirpath}{os.sep}{PROJECT_METADATA_NAME}')):
         return read_metadata_from_file(path)
 
     # Otherwise, open the builder
@@ -97,8 +386,8 @@ def read_metadata_from_file(path: str) -> ProjectMetadata:
         The metadata for the current / to-be workspace.
     """
 
-    with open(path, mode = 'r', encoding = 'UTF-8') as file:
-        return METADATA_CODEC.decode(json.load(file))
+    with open(path, mode = 'rb') as file:
+        return METADATA_CODEC.decode(_load_json(file.read()))
 
 def write_metadata_to_file(dirpath: str, metadata: ProjectMetadata) -> ProjectMetadata:
     """Writes a project metadata, named `project_metadata.json`, to a file location.
@@ -116,9 +405,8 @@ def write_metadata_to_file(dirpath: str, metadata: ProjectMetadata) -> ProjectMe
         The metadata for the current workspace.
     """
 
-    with open(os.sep.join([dirpath, PROJECT_METADATA_NAME]),
-            mode = 'w', encoding = 'UTF-8') as file:
-        print(json.dumps(METADATA_CODEC.encode(metadata), indent = 4), file = file)
+    with open(f'{dirpath}{os.sep}{PROJECT_METADATA_NAME}', mode = 'wb') as file:
+        file.write(_dump_json(METADATA_CODEC.encode(metadata)))
 
     return metadata
 
@@ -146,13 +434,35 @@ def setup_clean(metadata: ProjectMetadata, logger: Logger, config: JammiesConfig
     """
 
     # If the cache should be invalidated, delete the clean directory
-    if invalidate_cache and os.path.exists(clean_dir) and os.path.isdir(clean_dir):
+    if invalidate_cache and os.path.isdir(clean_dir):
         shutil.rmtree(clean_dir)
 
     # If the cache exists, then skip generation
     ## Otherwise generate the metadata information
-    return True if os.path.exists(clean_dir) and os.path.isdir(clean_dir) \
-        else metadata.setup(clean_dir, logger, config = config)
+    return True if os.path.isdir(clean_dir) else metadata.setup(clean_dir, logger, config = config)
+
+def _apply_patch_file(patch_path: str, work_path: str) -> bool:
+    """Applies a patch to a file in the working directory.
+
+    Parameters
+    ----------
+    patch_path : str
+        The path of the patch file.
+    work_path : str
+        The path of the file in the working directory to patch.
+
+    Returns
+    -------
+    bool
+        Whether the operation was successfully executed.
+    """
+
+    work_text: str = _read_text(work_path)
+
+    # Update work file with new information, if any
+    if (work_patch := apply_patch(work_text, _read_text(patch_path))) != work_text:
+        _write_text(work_path, work_patch)
+    return True
 
 def apply_patches(working_dir: str = 'src', patch_dir: str = 'patches') -> bool:
     """Applies patches to the working directory.
@@ -171,23 +481,20 @@ def apply_patches(working_dir: str = 'src', patch_dir: str = 'patches') -> bool:
     """
 
     # Assume both directories are present
-    for subdir, _, files in os.walk(patch_dir):
-        for file in files:
-            patch_path: str = os.path.join(subdir, file)
-            # Get the relative path of the file for the working directory
-            rel_path: str = patch_path[(len(patch_dir) + 1):-(len(_PATCH_EXTENSION) + 1)]
-
-            # Apply patch to working directory
-            with open(patch_path, mode = 'r', encoding = 'UTF-8') as patch_file, \
-                    open(os.path.join(working_dir, rel_path),
-                        mode = 'r+', encoding = 'UTF-8') as work_file:
-                work_patch: str = apply_patch(work_file.read(), patch_file.read())
-                # Update work file with new information
-                work_file.seek(0)
-                work_file.write(work_patch)
-                work_file.truncate()
+    patch_prefix_len: int = len(patch_dir) + 1
+    work_prefix: str = working_dir + os.sep
 
-    return True
+    patches: List[Tuple[str, str]] = []
+    for patch_path in _iter_files(patch_dir): # type: str
+        # Get the relative path of the file for the working directory
+        rel_path: str = patch_path[patch_prefix_len:-_PATCH_SUFFIX_LEN]
+        patches.append((patch_path, work_prefix + rel_path))
+
+    # Apply patches to working directory, each file is independent
+    with ThreadPoolExecutor(max_workers = _MAX_WORKERS) as executor:
+        results: List[bool] = list(executor.map(lambda paths: _apply_patch_file(*paths), patches))
+
+    return all(results)
 
 def setup_working(clean_dir: str = 'clean', working_dir: str = 'src',
         patch_dir: str = 'patches', out_dir: str = 'out', include_hidden: bool = False) -> bool:
@@ -213,22 +520,25 @@ def setup_working(clean_dir: str = 'clean', working_dir: str = 'src',
         Whether the operation was successfully executed.
     """
 
-    # Remove existing working directory if exists
-    if os.path.exists(working_dir) and os.path.isdir(working_dir):
-        shutil.rmtree(working_dir)
+    # Collect the clean files (clean directory must exist)
+    ## If an output directory exists, its files replace the clean files
+    files, subdirs = _scan_tree(clean_dir, include_hidden = include_hidden)
+    if (has_out_dir := os.path.isdir(out_dir)):
+        out_files, out_subdirs = _scan_tree(out_dir)
+        files.update(out_files)
+        subdirs.update(out_subdirs)
 
-    # Generate working directory (shouldn't exist)
-    os.makedirs(working_dir)
+    # Only copy the files missing or changed in the working directory
+    os.makedirs(working_dir, exist_ok = True)
+    _sync_tree(files, subdirs, working_dir)
 
-    # Copy clean directory into working directory (clean directory must exist)
-    if include_hidden:
-        shutil.copytree(clean_dir, working_dir, dirs_exist_ok = True)
-    else:
-        shutil.copytree(clean_dir, working_dir, dirs_exist_ok = True,
-            ignore = shutil.ignore_patterns('.*'))
+    # Copy the metadata of the root directories, output last
+    shutil.copystat(clean_dir, working_dir)
+    if has_out_dir:
+        shutil.copystat(out_dir, working_dir)
 
-    return setup_working_raw(working_dir = working_dir, patch_dir = patch_dir,
-        out_dir = out_dir)
+    # If the patches directory exists, apply patches to working directory
+    return apply_patches(working_dir, patch_dir) if os.path.isdir(patch_dir) else True
 
 def setup_working_raw(working_dir: str = 'src', patch_dir: str = 'patches',
         out_dir: str = 'out') -> bool:
@@ -251,13 +561,11 @@ def setup_working_raw(working_dir: str = 'src', patch_dir: str = 'patches',
     """
 
     # If an output directory exists, copy into working directory
-    if os.path.exists(out_dir) and os.path.isdir(out_dir):
-        shutil.copytree(out_dir, working_dir, dirs_exist_ok = True)
+    if os.path.isdir(out_dir):
+        _copy_tree(out_dir, working_dir)
 
     # If the patches directory exists, apply patches to working directory
-    return apply_patches(working_dir, patch_dir) \
-        if os.path.exists(patch_dir) and os.path.isdir(patch_dir) \
-        else True
+    return apply_patches(working_dir, patch_dir) if os.path.isdir(patch_dir) else True
 
 def check_existing_patch(rel_patch_path: str, patch_path: str,
         patch_text: str, patch_dir: str = 'patches') -> bool:
@@ -297,7 +605,8 @@ def check_existing_patch(rel_patch_path: str, patch_path: str,
     return False
 
 def generate_patch(path: str, work_path: str, clean_path: str,
-        patch_dir: str = 'patches', time: str = str(datetime.now())) -> bool:
+        patch_dir: str = 'patches', time: str | None = None,
+        created_dirs: Set[str] | None = None) -> bool:
     """Generates a patch between two files if they are not equal.
 
     Parameters
@@ -310,8 +619,11 @@ def generate_patch(path: str, work_path: str, clean_path: str,
         The path of the file in the clean directory.
     patch_dir : str (default 'patches')
         The directory containing the patches for the project files.
-    time : str  (default `datetime.datetime.now`)
-        The time the patch was generated.
+    time : str | None (default None)
+        The time the patch was generated. When `None`, uses the current time.
+    created_dirs : set of strs | None (default None)
+        The directories already created, shared between calls to skip creating
+        the same directory again.
     
     Returns
     -------
@@ -320,28 +632,26 @@ def generate_patch(path: str, work_path: str, clean_path: str,
     """
 
     # Assume patches directory exists
-    with open(work_path, mode = 'r', encoding = 'UTF-8') as work_file, \
-            open(clean_path, mode = 'r', encoding = 'UTF-8') as clean_file:
-        # Generate patch file if not empty
-        if (patch_text := create_patch(clean_file.read(), work_file.read(),
-                filename = path,
-                time = time)):
-            rel_patch_path: str = os.extsep.join([path, _PATCH_EXTENSION])
-            patch_path: str = os.path.join(patch_dir, rel_patch_path)
+    # Generate patch file if not empty
+    if (patch_text := create_patch(_read_text(clean_path), _read_text(work_path),
+            filename = path,
+            time = time)):
+        rel_patch_path: str = os.extsep.join([path, _PATCH_EXTENSION])
+        patch_path: str = os.path.join(patch_dir, rel_patch_path)
 
-            # Create directory if necessary
-            os.makedirs(os.path.dirname(patch_path), exist_ok = True)
+        # Create directory if necessary
+        _make_parent_dir(patch_path, created_dirs = created_dirs)
 
-            if check_existing_patch(rel_patch_path, patch_path, patch_text, patch_dir = patch_dir):
-                return True
+        if check_existing_patch(rel_patch_path, patch_path, patch_text, patch_dir = patch_dir):
+            return True
 
-            # Otherwise write new patch
-            with open(patch_path, mode = 'w', encoding = 'UTF-8') as patch_file:
-                patch_file.write(patch_text)
+        # Otherwise write new patch
+        _write_text(patch_path, patch_text)
 
     return True
 
-def output_file(path: str, work_path: str, out_dir: str = 'out') -> bool:
+def output_file(path: str, work_path: str, out_dir: str = 'out',
+        created_dirs: Set[str] | None = None) -> bool:
     """Copies an additional file for the workspace to the output directory.
     
     Parameters
@@ -352,6 +662,9 @@ def output_file(path: str, work_path: str, out_dir: str = 'out') -> bool:
         The path of the file in the working directory.
     out_dir : str (default 'out')
         The directory containing additional files for the workspace.
+    created_dirs : set of strs | None (default None)
+        The directories already created, shared between calls to skip creating
+        the same directory again.
 
     Returns
     -------
@@ -363,7 +676,7 @@ def output_file(path: str, work_path: str, out_dir: str = 'out') -> bool:
 
     out_path: str = os.path.join(out_dir, path)
     # Create directory if necessary
-    os.makedirs(os.path.dirname(out_path), exist_ok = True)
+    _make_parent_dir(out_path, created_dirs = created_dirs)
     shutil.copy(work_path, out_path)
 
     return True
@@ -398,39 +711,65 @@ def output_working(metadata: ProjectMetadata, clean_dir: str = 'clean', working_
     os.makedirs(_TMP_DIR, exist_ok = True)
 
     # If patch directory and output exist, delete them
-    if os.path.exists(out_dir) and os.path.isdir(out_dir):
+    if os.path.isdir(out_dir):
         shutil.rmtree(out_dir)
-    if os.path.exists(patch_dir) and os.path.isdir(patch_dir):
+    if os.path.isdir(patch_dir):
         shutil.move(patch_dir, _TMP_DIR)
 
     # Generate ignored and overwritten list
     ignore, overwrite = metadata.ignore_and_overwrite(working_dir) # Set[str], Set[str]
 
-    for subdir, _, files in os.walk(working_dir):
-        for file in files:
-            # Setup paths
-            work_path: str = os.path.join(subdir, file)
-            rel_path: str = work_path[(len(working_dir) + 1):]
-            clean_path: str = os.path.join(clean_dir, rel_path)
-            rel_path_posix: str = PurePath(rel_path).as_posix()
-
-            if rel_path_posix in ignore:
-                pass # Do nothing if files are ignored
-
-            # If clean file exists, generate patch and write
-            elif os.path.exists(clean_path):
-                if rel_path_posix in overwrite:
-                    # Copy file to output if overwrite
-                    output_file(rel_path, work_path, out_dir = out_dir)
-                else:
-                    # Otherwise generate the patch
-                    generate_patch(rel_path, work_path, clean_path,
-                        patch_dir = patch_dir, time = time)
-
-            # Otherwise output files to directory
-            else:
-                output_file(rel_path, work_path, out_dir = out_dir)
+    work_prefix_len: int = len(working_dir) + 1
+    clean_prefix: str = clean_dir + os.sep
+    created_dirs: Set[str] = set()
+
+    # Collect the relative paths of all clean files in one pass
+    clean_prefix_len: int = len(clean_prefix)
+    clean_files: Set[str] = set(path[clean_prefix_len:] for path in _iter_files(clean_dir)) \
+        if os.path.isdir(clean_dir) else set()
+
+    def output_working_file(work_path: str) -> bool:
+        """Generates the patch or copies the file in the working directory
+        to the output directory.
+
+        Parameters
+        ----------
+        work_path : str
+            The path of the file in the working directory.
+
+        Returns
+        -------
+        bool
+            Whether the operation was successfully executed.
+        """
+
+        # Setup paths
+        rel_path: str = work_path[work_prefix_len:]
+        clean_path: str = clean_prefix + rel_path
+        rel_path_posix: str = PurePath(rel_path).as_posix()
+
+        if rel_path_posix in ignore:
+            return True # Do nothing if files are ignored
+
+        # If clean file exists, generate patch and write
+        if rel_path in clean_files:
+            # Copy file to output if overwrite
+            if rel_path_posix in overwrite:
+                return output_file(rel_path, work_path, out_dir = out_dir,
+                    created_dirs = created_dirs)
+
+            # Otherwise generate the patch
+            return generate_patch(rel_path, work_path, clean_path,
+                patch_dir = patch_dir, time = time, created_dirs = created_dirs)
+
+        # Otherwise output files to directory
+        return output_file(rel_path, work_path, out_dir = out_dir,
+            created_dirs = created_dirs)
+
+    # Output each file independently
+    with ThreadPoolExecutor(max_workers = _MAX_WORKERS) as executor:
+        results: List[bool] = list(executor.map(output_working_file, _iter_files(working_dir)))
 
     # Delete temp directory afterwards
     shutil.rmtree(_TMP_DIR)
-    return True
+    return all(results)